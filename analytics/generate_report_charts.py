@@ -1,11 +1,31 @@
 # analytics/generate_report_charts.py
+from pathlib import Path
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg') # File output only: skip interactive backend setup
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load Data
+CSV_PATH = Path('../experiments/results_template.csv')
+PARQUET_PATH = CSV_PATH.with_suffix('.parquet') # Columnar mirror, written on first load
+COLUMNS = ['method', 'gpu_hours', 'TC_norm', 'rho', 'novelty'] # Only what the charts use
+
+def load_results():
+    # Prefer the Parquet mirror unless the CSV has been edited since it was written
+    # (or is gone altogether)
+    if PARQUET_PATH.exists() and (not CSV_PATH.exists() or
+                                  PARQUET_PATH.stat().st_mtime >= CSV_PATH.stat().st_mtime):
+        return pd.read_parquet(PARQUET_PATH, columns=COLUMNS)
+    df = pd.read_csv(CSV_PATH, engine='pyarrow', usecols=COLUMNS)
+    try:
+        df.to_parquet(PARQUET_PATH)
+    except (OSError, ImportError):
+        pass # Read-only checkout or no Parquet writer: the mirror is only a cache
+    return df
+
 try:
-    df = pd.read_csv('../experiments/results_template.csv')
+    df = load_results()
 except FileNotFoundError:
     # Fallback for demo
     data = {
@@ -20,27 +40,32 @@ except FileNotFoundError:
 # Set Style
 sns.set(style="whitegrid")
 
+# Both charts share one Figure; each panel is saved by cropping to its own bbox
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 6))
+
+def save_panel(ax, path):
+    bbox = ax.get_tightbbox(fig.canvas.get_renderer())
+    fig.savefig(path, bbox_inches=bbox.transformed(fig.dpi_scale_trans.inverted()).padded(0.1))
+
 # 1. GPU Cost & Quality Trade-off
-plt.figure(figsize=(10, 6))
-sns.scatterplot(data=df, x='gpu_hours', y='TC_norm', hue='method', s=200, style='method')
-plt.title('Love-OS Impact: Lower Cost, Higher Quality', fontsize=15)
-plt.xlabel('GPU Hours (Lower is Better)', fontsize=12)
-plt.ylabel('Quality (TC_norm) (Higher is Better)', fontsize=12)
-plt.axvline(x=2.0, color='gray', linestyle='--')
-plt.text(2.1, 0.60, 'Traditional Frontier', color='gray')
-plt.text(1.3, 0.72, 'Love-OS Frontier', color='green', weight='bold')
-plt.tight_layout()
-plt.savefig('../docs/images/chart_cost_quality.png')
-print("Chart generated: chart_cost_quality.png")
+sns.scatterplot(data=df, x='gpu_hours', y='TC_norm', hue='method', s=200, style='method', ax=ax1)
+ax1.set_title('Love-OS Impact: Lower Cost, Higher Quality', fontsize=15)
+ax1.set_xlabel('GPU Hours (Lower is Better)', fontsize=12)
+ax1.set_ylabel('Quality (TC_norm) (Higher is Better)', fontsize=12)
+ax1.axvline(x=2.0, color='gray', linestyle='--')
+ax1.text(2.1, 0.60, 'Traditional Frontier', color='gray')
+ax1.text(1.3, 0.72, 'Love-OS Frontier', color='green', weight='bold')
 
 # 2. Key Metrics Radar (Simplified Bar for now)
 metrics = ['rho', 'novelty']
 df_melt = df.melt(id_vars='method', value_vars=metrics, var_name='Metric', value_name='Score')
 
-plt.figure(figsize=(10, 6))
-sns.barplot(data=df_melt, x='Metric', y='Score', hue='method', palette='viridis')
-plt.title('Love-OS: Meaning Density & Novelty Boost', fontsize=15)
-plt.ylim(0, 1.0)
-plt.tight_layout()
-plt.savefig('../docs/images/chart_metrics_comparison.png')
+sns.barplot(data=df_melt, x='Metric', y='Score', hue='method', palette='viridis', ax=ax2)
+ax2.set_title('Love-OS: Meaning Density & Novelty Boost', fontsize=15)
+ax2.set_ylim(0, 1.0)
+
+fig.canvas.draw() # Lay out once so both panel bboxes are final
+save_panel(ax1, '../docs/images/chart_cost_quality.png')
+print("Chart generated: chart_cost_quality.png")
+save_panel(ax2, '../docs/images/chart_metrics_comparison.png')
 print("Chart generated: chart_metrics_comparison.png")
@@ -1,4 +1,5 @@
 import numpy as np
+import numexpr as ne
 import matplotlib.pyplot as plt
 
 # --- Love-OS v1.3 Parameters ---
@@ -27,19 +28,33 @@ def potential_V(A, R):
     term_noise      = zeta * N
     return term_attraction + term_repulsion + term_noise
 
+def potential_V_grid(A, R):
+    # Same as potential_V, fused into a single numexpr kernel
+    # (no grid-sized temporaries for the power / exp terms)
+    return ne.evaluate(
+        "-gamma * (A ** alpha_A) / (1 + exp(-s_A * (A - theta_A))) * C_info * TC_norm"
+        " + delta * (R ** beta_R) + zeta * N",
+        local_dict={
+            "A": A, "R": R,
+            "gamma": gamma, "delta": delta, "zeta": zeta,
+            "alpha_A": alpha_A, "theta_A": theta_A, "s_A": s_A, "beta_R": beta_R,
+            "C_info": C_info, "TC_norm": TC_norm, "N": N,
+        },
+    )
+
 # --- Grid Generation ---
 A_vals = np.linspace(0.01, 1.0, 100) # Awakening 0 to 100%
 R_vals = np.linspace(0.01, 1.0, 100) # Resistance 0 to 100%
 A_grid, R_grid = np.meshgrid(A_vals, R_vals)
 
-V_grid = potential_V(A_grid, R_grid)
+V_grid = potential_V_grid(A_grid, R_grid)
 
 # --- Visualization ---
 plt.figure(figsize=(10, 8))
 
-# Contour Plot (Potential Landscape)
-# Levels: Lower V is better (Stable)
-cp = plt.contourf(A_grid, R_grid, V_grid, levels=20, cmap='coolwarm_r') # Reverse coolwarm: Blue=Low(Stable), Red=High(Unstable)
+# Shaded Mesh (Potential Landscape) - no contour computation needed for a smooth field
+# Lower V is better (Stable)
+cp = plt.pcolormesh(A_grid, R_grid, V_grid, cmap='coolwarm_r', shading='gouraud') # Reverse coolwarm: Blue=Low(Stable), Red=High(Unstable)
 plt.colorbar(cp, label='Potential Energy V (Lower is More Stable)')
 
 # Add Annotations
@@ -15,7 +15,7 @@ Preset: CREATIVITY-FIRST (CREATIVE_MAX)
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, ClassVar, Tuple
 
 # ==========================================
 # 1. Configuration: Creativity-First Preset
@@ -38,13 +38,14 @@ CREATIVE_MAX_CONFIG = {
     },
     "diversity_alpha": 0.65, # MMR Balance (Favors Novelty over Redundancy)
     "exception_boost": 1.35, # Boost for 'Exceptions'
-    "K": 5                   # Number of items to select
+    "K": 5,                  # Number of items to select
+    "seed": None             # RNG seed for mock novelty (None = fresh entropy)
 }
 
 # ==========================================
 # 2. Data Structures
 # ==========================================
-@dataclass
+@dataclass(slots=True) # No per-instance __dict__ (Python 3.10+)
 class Candidate:
     id: str
     content: Any  # Image, Text, Latents, etc.
@@ -80,11 +81,35 @@ class Candidate:
     M_norm: float = 0.0
     lambda_score: float = 0.0 # Inverted lambda
     phi_norm: float = 0.0
+    norm_vec: Optional[np.ndarray] = None # Min-max normalized raw metrics, in _RAW order
+
+    # Column order of the raw metric matrix used during normalization
+    _RAW: ClassVar[Tuple[str, ...]] = ('rho', 'gamma', 'beta', 'd', 'sigma', 'M', 'lambda')
 
 @dataclass
 class AuditLog:
     selected_candidates: List[Dict[str, Any]]
 
+# Column layout of CandidateBatch.metrics (same order as the Intuition Equation)
+NOVELTY, RHO, SIGMA, REACH, GAMMA, LAMBDA, BETA, M = range(8)
+METRIC_COLUMNS = ('novelty', 'rho', 'sigma', 'd', 'gamma', 'lambda', 'beta', 'M')
+
+@dataclass
+class CandidateBatch:
+    """Struct-of-Arrays view of a candidate pool, used inside the selector."""
+    ids: List[str]
+    raw: np.ndarray          # (N, 7) raw metrics in Candidate._RAW order
+    phi: np.ndarray          # (N,)   raw phase difference
+    embeddings: np.ndarray   # (N, D)
+    is_exception: np.ndarray # (N,)   bool
+    norm: Optional[np.ndarray] = None      # (N, 7) min-max normalized raw metrics
+    metrics: Optional[np.ndarray] = None   # (N, 8) scores in METRIC_COLUMNS order
+    d_norm: Optional[np.ndarray] = None    # (N,)   normalized distance
+    composite: Optional[np.ndarray] = None # (N,)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
 # ==========================================
 # 3. The Intuition Selector Class
 # ==========================================
@@ -93,136 +118,165 @@ class IntuitionSelector:
         self.cfg = config
         self.weights = config["weights"]
         self.constraints = config["hard_constraints"]
+        # Weights of the Intuition Equation, in METRIC_COLUMNS order
+        self.w_vec = np.array([self.weights[k] for k in METRIC_COLUMNS], dtype=np.float64)
+        # Scalars read on every select() call
+        self._constraints_tuple = (self.constraints["beta_min"],
+                                   self.constraints["gamma_min"],
+                                   self.constraints["phi_tol"])
+        self._boost = config["exception_boost"]
+        self._alpha = config["diversity_alpha"]
+        self._K = config["K"]
+        # One Generator for all draws (no legacy global-RNG dispatch per call)
+        self._rng = np.random.default_rng(config.get("seed"))
         
     def select(self, candidates: List[Candidate], r_buffer_stats: Dict) -> AuditLog:
         """
         Main pipeline: Normalize -> Boost -> Filter -> Score -> MMR -> Select
         """
+        if not candidates:
+            return AuditLog(selected_candidates=[])
+        batch = self._to_batch(candidates)
+        
         # A. Preprocessing & Normalization
-        self._normalize_metrics(candidates)
+        self._normalize_metrics(batch)
         
         # B. Calculate Novelty & Boost Exceptions
-        self._apply_right_brain_boosts(candidates, r_buffer_stats)
+        self._apply_right_brain_boosts(batch, r_buffer_stats)
         
         # C. Hard Constraints (Filtering)
-        filtered = self._apply_constraints(candidates)
-        if not filtered:
+        mask = self._apply_constraints(batch)
+        if not mask.any():
             print("Warning: All candidates filtered. Relaxing constraints...")
-            filtered = candidates # Fallback: return all if filter is too strict
+            mask[:] = True # Fallback: return all if filter is too strict
+        filtered = np.nonzero(mask)[0]
 
         # D. Calculate Composite Score
-        for c in filtered:
-            self._compute_composite_score(c)
+        batch.composite = np.zeros(len(batch))
+        batch.composite[filtered] = self._compute_composite_score(batch.metrics[filtered])
             
         # E. Diversity Selection (MMR)
-        selected = self._apply_mmr_selection(filtered)
+        picked = self._apply_mmr_selection(batch.composite[filtered], batch.embeddings[filtered])
         
         # F. Generate Audit Log
-        return self._generate_audit_log(selected)
+        self._write_back(batch, candidates)
+        return self._generate_audit_log([candidates[i] for i in filtered[picked]])
+
+    def _to_batch(self, candidates: List[Candidate]) -> CandidateBatch:
+        n, attrs = len(candidates), Candidate._RAW
+        raw = np.fromiter(
+            (getattr(c, f"{attr}_raw") for c in candidates for attr in attrs),
+            dtype=np.float64, count=n * len(attrs)
+        ).reshape(n, len(attrs))
+        return CandidateBatch(
+            ids=[c.id for c in candidates],
+            raw=raw,
+            phi=np.fromiter((c.phi_raw for c in candidates), dtype=np.float64, count=n),
+            embeddings=np.stack([np.asarray(c.embedding, dtype=np.float64) for c in candidates]),
+            is_exception=np.array([c.is_exception for c in candidates], dtype=bool),
+        )
 
-    def _normalize_metrics(self, candidates: List[Candidate]):
+    def _normalize_metrics(self, batch: CandidateBatch):
         # Simple Min-Max normalization logic for demo purposes
         # In production, use global stats from TC_norm
-        if not candidates: return
+        raw = batch.raw
+        mins = raw.min(axis=0)
+        spans = raw.max(axis=0) - mins
+        norm = (raw - mins) / np.where(spans > 1e-9, spans, 1.0)
+        rho, gamma, beta, d, sigma, M_, lam = norm.T
         
-        for attr in ['rho', 'gamma', 'beta', 'd', 'sigma', 'M', 'lambda']:
-            raw_vals = [getattr(c, f"{attr}_raw") for c in candidates]
-            _min, _max = min(raw_vals), max(raw_vals)
-            div = (_max - _min) if (_max - _min) > 1e-9 else 1.0
-            
-            for c in candidates:
-                val = getattr(c, f"{attr}_raw")
-                norm = (val - _min) / div
-                
-                if attr == 'lambda':
-                    # Short description (low lambda) is good -> Invert
-                    c.lambda_score = 1.0 - norm 
-                elif attr == 'd':
-                     # Low distance is good -> Reachability
-                    c.d_norm = norm 
-                    c.reachability = 1.0 - norm
-                else:
-                    setattr(c, f"{attr}_norm", norm)
-                    
-                # Handle Phase (Phi) separately (absolute distance from 0)
-                c.phi_norm = abs(c.phi_raw)
+        m = np.empty((len(batch), len(METRIC_COLUMNS)))
+        m[:, NOVELTY] = 0.0
+        m[:, RHO] = rho
+        m[:, SIGMA] = sigma
+        m[:, REACH] = 1.0 - d     # Low distance is good -> Reachability
+        m[:, GAMMA] = gamma
+        m[:, LAMBDA] = 1.0 - lam  # Short description (low lambda) is good -> Invert
+        m[:, BETA] = beta
+        m[:, M] = M_
+        batch.norm = norm
+        batch.metrics = m
+        batch.d_norm = d
 
-    def _apply_right_brain_boosts(self, candidates: List[Candidate], r_stats: Dict):
-        boost = self.cfg["exception_boost"]
+    def _apply_right_brain_boosts(self, batch: CandidateBatch, r_stats: Dict):
+        boost = self._boost
+        m = batch.metrics
         
-        for c in candidates:
-            # 1. Novelty Calculation (Distance from R-buffer center)
-            # Placeholder: In real impl, calculate dist(c.embedding, r_stats['center'])
-            c.novelty = np.random.uniform(0.5, 1.0) # Mocking novelty for now
-            
-            # 2. Boost Exceptions (The core of Love-OS)
-            if c.is_exception:
-                # "Mistakes" are high-density meaning points
-                c.rho_norm = min(1.0, c.rho_norm * boost)
-                c.novelty  = min(1.0, c.novelty * boost)
+        # 1. Novelty Calculation (Distance from R-buffer center)
+        # Placeholder: In real impl, calculate dist(c.embedding, r_stats['center'])
+        m[:, NOVELTY] = self._rng.uniform(0.5, 1.0, size=len(batch)) # Mocking novelty for now
+        
+        # 2. Boost Exceptions (The core of Love-OS)
+        # "Mistakes" are high-density meaning points
+        exc = batch.is_exception
+        m[exc, RHO] = np.minimum(1.0, m[exc, RHO] * boost)
+        m[exc, NOVELTY] = np.minimum(1.0, m[exc, NOVELTY] * boost)
 
-    def _apply_constraints(self, candidates: List[Candidate]) -> List[Candidate]:
-        passed = []
-        hard = self.constraints
-        for c in candidates:
-            if c.beta_norm < hard["beta_min"]: continue
-            if c.gamma_norm < hard["gamma_min"]: continue
-            if c.phi_norm > hard["phi_tol"]: continue
-            passed.append(c)
-        return passed
+    def _apply_constraints(self, batch: CandidateBatch) -> np.ndarray:
+        beta_min, gamma_min, phi_tol = self._constraints_tuple
+        m = batch.metrics
+        # Phase (Phi) is the absolute distance from 0
+        return ((m[:, BETA] >= beta_min) &
+                (m[:, GAMMA] >= gamma_min) &
+                (np.abs(batch.phi) <= phi_tol))
 
-    def _compute_composite_score(self, c: Candidate):
-        w = self.weights
-        # The Intuition Equation
-        c.composite = (
-            w['novelty'] * c.novelty +
-            w['rho']     * c.rho_norm +
-            w['sigma']   * c.sigma_norm +
-            w['d']       * c.reachability +
-            w['gamma']   * c.gamma_norm +
-            w['lambda']  * c.lambda_score +
-            w['beta']    * c.beta_norm +
-            w['M']       * c.M_norm
-        )
+    def _compute_composite_score(self, metrics: np.ndarray) -> np.ndarray:
+        # The Intuition Equation: one (N, 8) x (8,) contraction.
+        # Reachability and lambda columns are already inverted by _normalize_metrics.
+        return np.einsum('nk,k->n', metrics, self.w_vec)
 
-    def _apply_mmr_selection(self, candidates: List[Candidate]) -> List[Candidate]:
+    def _apply_mmr_selection(self, composite: np.ndarray, embeddings: np.ndarray) -> List[int]:
         """
         Maximal Marginal Relevance to ensure diversity.
+        Returns row indices into `composite` in selection order.
         """
-        K = self.cfg["K"]
-        alpha = self.cfg["diversity_alpha"]
+        K, alpha = self._K, self._alpha
+        if len(composite) == 0 or K <= 0: return []
         
-        # Sort by initial score
-        remaining = sorted(candidates, key=lambda x: x.composite, reverse=True)
-        selected = []
+        # Preselect the top 4K composites (best first); the rest cannot realistically win
+        order = np.arange(len(composite))
+        if len(order) > 4 * K:
+            order = np.argpartition(-composite, 4 * K - 1)[:4 * K]
+        order = order[np.argsort(-composite[order], kind='stable')]
+        composite, embeddings = composite[order], embeddings[order]
+        n = len(order)
         
-        while len(selected) < K and remaining:
-            # First item is always the best composite score
-            if not selected:
-                best = remaining.pop(0)
-                selected.append(best)
-                continue
-                
-            # For subsequent items, balance Score vs Similarity
-            best_mmr_idx = -1
-            best_mmr_score = -float('inf')
-            
-            for i, cand in enumerate(remaining):
-                # Calculate max similarity to already selected items
-                # Mock similarity: np.dot(cand.embedding, s.embedding)
-                # Using random for demo logic safety
-                max_sim = np.random.uniform(0, 0.5) 
-                
-                mmr = alpha * cand.composite - (1.0 - alpha) * max_sim
-                
-                if mmr > best_mmr_score:
-                    best_mmr_score = mmr
-                    best_mmr_idx = i
-            
-            if best_mmr_idx != -1:
-                selected.append(remaining.pop(best_mmr_idx))
+        # Cosine similarity of every pair, computed once with a single GEMM
+        E = embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        S = E @ E.T
+        
+        # First item is always the best composite score
+        best = int(np.argmax(composite))
+        selected = [best]
+        alive = np.ones(n, dtype=bool)
+        alive[best] = False
+        max_sim = S[best].copy() # Max similarity of each candidate to the selected set
+        
+        # For subsequent items, balance Score vs Similarity
+        while len(selected) < K and alive.any():
+            mmr = alpha * composite - (1.0 - alpha) * max_sim
+            mmr[~alive] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            alive[best] = False
+            np.maximum(max_sim, S[best], out=max_sim)
                 
-        return selected
+        return order[selected].tolist()
+
+    def _write_back(self, batch: CandidateBatch, candidates: List[Candidate]):
+        """Copies the batch columns back onto the Candidate objects (for the Audit Log)."""
+        m = batch.metrics
+        rows = m.tolist()
+        phi_norm = np.abs(batch.phi).tolist()
+        d_norm = batch.d_norm.tolist()
+        composite = batch.composite.tolist()
+        for i, c in enumerate(candidates):
+            (c.novelty, c.rho_norm, c.sigma_norm, c.reachability,
+             c.gamma_norm, c.lambda_score, c.beta_norm, c.M_norm) = rows[i]
+            c.norm_vec = batch.norm[i].copy() # Own row, so the batch can be freed
+            c.d_norm = d_norm[i]
+            c.phi_norm = phi_norm[i]
+            c.composite = composite[i]
 
     def _generate_audit_log(self, selected: List[Candidate]) -> AuditLog:
         logs = []
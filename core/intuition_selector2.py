@@ -41,6 +41,9 @@ CREATIVE_MAX_CONFIG = {
     "K":               5     # Number of items to select
 }
 
+# Feature column order used for composite scoring (matches "weights")
+METRIC_COLUMNS = ('novelty', 'rho', 'sigma', 'd', 'gamma', 'lambda', 'beta', 'M')
+
 # ==========================================
 # 2. Main Logic: Intuition Selector
 # ==========================================
@@ -67,9 +70,14 @@ def intuition_selector(candidates: List[Any],
     # normalize_candidates(candidates) 
 
     # Invert 'lambda' and 'd' (Lower is better -> Higher score)
-    for c in candidates:
-        c.lambda_score = 1.0 - getattr(c, 'lambda_norm', 0.5)
-        c.reachability = 1.0 - getattr(c, 'd_norm', 0.5)
+    n = len(candidates)
+    lambda_score = 1.0 - np.fromiter((getattr(c, 'lambda_norm', 0.5) for c in candidates),
+                                     dtype=np.float64, count=n)
+    reachability = 1.0 - np.fromiter((getattr(c, 'd_norm', 0.5) for c in candidates),
+                                     dtype=np.float64, count=n)
+    for c, lam, reach in zip(candidates, lambda_score.tolist(), reachability.tolist()):
+        c.lambda_score = lam
+        c.reachability = reach
 
     # --- 2. Novelty & Exception Boosting (Right-Brain Logic) ---
     # Calculate Novelty based on distance from R-buffer center
@@ -85,58 +93,41 @@ def intuition_selector(candidates: List[Any],
             c.novelty  = min(1.0, c.novelty * exc_boost)
 
     # --- 3. Hard Constraint Filtering ---
-    filtered = []
-    for c in candidates:
-        if c.beta_norm < hard["beta_min"]: continue
-        if c.gamma_norm < hard["gamma_min"]: continue
-        if abs(c.phi_norm) > hard["phi_tol"]: continue
-        filtered.append(c)
+    # One boolean mask over all candidates (no per-candidate branches)
+    beta_norm = np.fromiter((c.beta_norm for c in candidates), dtype=np.float64, count=n)
+    gamma_norm = np.fromiter((c.gamma_norm for c in candidates), dtype=np.float64, count=n)
+    phi_norm = np.fromiter((c.phi_norm for c in candidates), dtype=np.float64, count=n)
+    mask = ((beta_norm >= hard["beta_min"]) &
+            (gamma_norm >= hard["gamma_min"]) &
+            (np.abs(phi_norm) <= hard["phi_tol"]))
 
     # Fallback: Relax constraints if too strict
-    if not filtered:
-        # filtered = relax_constraints(candidates, hard)
-        filtered = candidates # Temporary fallback
+    if not mask.any():
+        # mask = relax_constraints(candidates, hard)
+        mask[:] = True # Temporary fallback
+    filtered = [candidates[i] for i in np.nonzero(mask)[0]]
 
     # --- 4. Composite Scoring (Creativity Weighted) ---
-    for c in filtered:
-        c.composite = (
-            w['novelty'] * c.novelty      +
-            w['rho']     * c.rho_norm     +
-            w['sigma']   * c.sigma_norm   +
-            w['d']       * c.reachability +
-            w['gamma']   * c.gamma_norm   +
-            w['lambda']  * c.lambda_score +
-            w['beta']    * c.beta_norm    +
-            w['M']       * getattr(c, 'M_norm', 0)
-        )
+    # One (N, 8) x (8,) contraction over the feature matrix
+    w_vec = np.array([w[k] for k in METRIC_COLUMNS], dtype=np.float64)
+    features = np.array([
+        [c.novelty, c.rho_norm, c.sigma_norm, c.reachability,
+         c.gamma_norm, c.lambda_score, c.beta_norm, getattr(c, 'M_norm', 0)]
+        for c in filtered
+    ], dtype=np.float64).reshape(len(filtered), len(METRIC_COLUMNS))
+    composite = np.einsum('nk,k->n', features, w_vec)
+    for c, score in zip(filtered, composite.tolist()):
+        c.composite = score
 
     # --- 5. Diversity Selection (Pareto + MMR) ---
-    # Sort by Score first
-    remaining = sorted(filtered, key=lambda x: x.composite, reverse=True)
-    s_top = []
-
-    while len(s_top) < K and remaining:
-        # Pick the absolute best first
-        if not s_top:
-            s_top.append(remaining.pop(0))
-            continue
-            
-        # For subsequent picks, use MMR (Score - Similarity penalty)
-        best_idx = -1
-        best_mmr_val = -float('inf')
-
-        for i, cand in enumerate(remaining):
-            # sim_to_S = max(similarity(cand, s) for s in s_top)
-            sim_to_S = 0.5 # Placeholder
-            
-            mmr = alpha * cand.composite - (1.0 - alpha) * sim_to_S
-            
-            if mmr > best_mmr_val:
-                best_mmr_val = mmr
-                best_idx = i
-        
-        if best_idx != -1:
-            s_top.append(remaining.pop(best_idx))
+    # Only the top 4K by score enter MMR, best first
+    order = top_k_order(composite, 4 * K)
+    embeddings = [getattr(filtered[i], 'embedding', None) for i in order]
+    if embeddings and all(e is not None for e in embeddings):
+        sim = similarity_matrix(np.stack(embeddings))
+    else:
+        sim = np.full((len(order), len(order)), 0.5) # Placeholder
+    s_top = [filtered[order[i]] for i in mmr_select(composite[order], sim, K, alpha)]
 
     # --- 6. Audit Log & Feedback ---
     audit_log = []
@@ -158,6 +149,47 @@ def intuition_selector(candidates: List[Any],
 
     return s_top, audit_log
 
+# --- Helper: Diversity (MMR) ---
+def top_k_order(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, sorted best first (argpartition, no full sort)."""
+    order = np.arange(len(scores))
+    if len(order) > k:
+        order = np.argpartition(-scores, k - 1)[:k]
+    return order[np.argsort(-scores[order], kind='stable')]
+
+def similarity_matrix(embeddings: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every candidate pair, computed with a single GEMM."""
+    E = np.asarray(embeddings, dtype=np.float64)
+    E = E / np.maximum(np.linalg.norm(E, axis=1, keepdims=True), 1e-12)
+    return E @ E.T
+
+def mmr_select(composite: np.ndarray, sim: np.ndarray, K: int, alpha: float) -> List[int]:
+    """
+    Maximal Marginal Relevance over precomputed similarities.
+    Returns indices into `composite` in selection order.
+    """
+    n = len(composite)
+    if n == 0 or K <= 0:
+        return []
+
+    # Pick the absolute best first
+    best = int(np.argmax(composite))
+    selected = [best]
+    alive = np.ones(n, dtype=bool)
+    alive[best] = False
+    max_sim = sim[best].copy() # sim_to_S for every remaining candidate
+
+    # For subsequent picks, use MMR (Score - Similarity penalty)
+    while len(selected) < K and alive.any():
+        mmr = alpha * composite - (1.0 - alpha) * max_sim
+        mmr[~alive] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(best)
+        alive[best] = False
+        np.maximum(max_sim, sim[best], out=max_sim)
+
+    return selected
+
 # --- Helper: Explain the Choice (The "Translator") ---
 def explain_choice(c: Any) -> str:
     """Generates a natural language explanation for the Left Brain."""
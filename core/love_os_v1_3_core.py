@@ -1,5 +1,7 @@
 import numpy as np
+from numba import njit
 from scipy.stats import beta, entropy
+from scipy.special import betaln, digamma, rel_entr
 from typing import List, Dict, Tuple
 
 class LoveConfig:
@@ -21,6 +23,29 @@ class LoveConfig:
         # Maximum Information Capacities (Bit)
         self.KL_max = 5.0  # Max divergence for normalization
         
+@njit(cache=True, fastmath=True)
+def _step_math(A_t, w, I, TC_norm, R, N,
+               gamma, delta, zeta, alpha_A, theta_A, s_A, beta_R):
+    """
+    Closed-form terms of one control step, compiled to machine code.
+    `w` and `I` must have the same length (checked by the caller).
+    Returns (V, G, phi_A, C_info, dA).
+    """
+    # Weighted Channel Capacity
+    C_info = 0.0
+    for k in range(w.shape[0]):
+        C_info += w[k] * I[k]
+
+    # Awakening Amplification (Sigmoid)
+    phi_A = A_t ** alpha_A / (1.0 + np.exp(-s_A * (A_t - theta_A)))
+
+    # V = -Term1(Attraction) + Term2(Repulsion) + Term3(Noise)
+    V = -gamma * phi_A * C_info * TC_norm + delta * R ** beta_R + zeta * N
+
+    # Awakening increases as R decreases and C_info increases (Feedback loop)
+    dA = 0.05 * (C_info * TC_norm) - 0.02 * R
+    return V, -V, phi_A, C_info, dA
+
 class UnresolvedItem:
     """
     Represents an element of U_t (Unresolved Logic/Doubt).
@@ -43,6 +68,40 @@ class UnresolvedItem:
         # Lower entropy means higher certainty (resolved)
         return beta.entropy(self.alpha, self.beta)
 
+class UnresolvedItemPool:
+    """
+    Vectorized U_t: the Beta parameters of all Unresolved Items as arrays.
+    Total entropy is one closed-form NumPy expression instead of
+    one SciPy distribution call per item, cached until the next update().
+    """
+    def __init__(self, names: List[str], alpha=1.0, beta=1.0):
+        self.names = list(names)
+        self.alpha = np.full(len(self.names), alpha, dtype=np.float64)
+        self.beta = np.full(len(self.names), beta, dtype=np.float64)
+        self._H = None # Cached entropies, None when stale
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def update(self, evidence_vector) -> None:
+        """Bayesian Update per item: evidence > 0 is positive, otherwise negative"""
+        ev = np.asarray(evidence_vector, dtype=np.float64)[:len(self.names)]
+        n = len(ev)
+        pos = ev > 0
+        self.alpha[:n] += np.where(pos, ev, 0.0)
+        self.beta[:n] += np.where(pos, 0.0, np.abs(ev))
+        self._H = None
+
+    def get_entropies(self) -> np.ndarray:
+        """Differential Entropy of each item's Beta belief (closed form)"""
+        if self._H is None:
+            a, b = self.alpha, self.beta
+            self._H = (betaln(a, b)
+                       - (a - 1) * digamma(a)
+                       - (b - 1) * digamma(b)
+                       + (a + b - 2) * digamma(a + b))
+        return self._H
+
 class LoveControlSystem:
     """
     Love-OS v1.3 Kernel
@@ -57,28 +116,22 @@ class LoveControlSystem:
         
         # Unresolved Items (U_t) -> Source of Resistance R
         # Initial state: High Uncertainty (Uniform Distribution alpha=1, beta=1)
-        self.U_t: List[UnresolvedItem] = [
-            UnresolvedItem("Trust_Mechanism"),
-            UnresolvedItem("Value_Alignment"),
-            UnresolvedItem("Future_Safety")
-        ]
+        self.U_t = UnresolvedItemPool([
+            "Trust_Mechanism",
+            "Value_Alignment",
+            "Future_Safety"
+        ])
         
-    def _phi_A(self, A: float) -> float:
-        """Awakening Amplification Function (Sigmoid)"""
-        numerator = A ** self.cfg.alpha_A
-        denominator = 1 + np.exp(-self.cfg.s_A * (A - self.cfg.theta_A))
-        return numerator / denominator
-
     def _calculate_R(self) -> float:
         """Calculate Total Resistance (Sum of Entropies of U_t)"""
-        total_entropy = sum([item.get_entropy() for item in self.U_t])
+        total_entropy = float(self.U_t.get_entropies().sum())
         # Normalize/Scale logic (simplified)
         return max(0, total_entropy)
 
     def _calculate_TC_norm(self, P_dist, Q_dist) -> float:
         """Calculate Normalized Trust Consistency based on KL Divergence"""
-        # epsilon added for numerical stability
-        kl = np.sum(P_dist * np.log(P_dist / (Q_dist + 1e-9)))
+        # epsilon added for numerical stability; rel_entr treats P=0 terms as 0 (no NaN)
+        kl = rel_entr(P_dist, Q_dist + 1e-9).sum()
         tc = 1.0 - (kl / self.cfg.KL_max)
         return max(0, min(1.0, tc))
 
@@ -91,32 +144,31 @@ class LoveControlSystem:
         """
         Execute one control cycle (Time step t -> t+1)
         """
+        # The compiled kernel does not bounds-check: validate shapes up front
+        I_values = np.ascontiguousarray(I_values, dtype=np.float64)
+        P_dist = np.asarray(P_dist, dtype=np.float64)
+        Q_dist = np.asarray(Q_dist, dtype=np.float64)
+        if I_values.shape != self.weights.shape:
+            raise ValueError(f"I_values has shape {I_values.shape}, expected {self.weights.shape}")
+        if P_dist.shape != Q_dist.shape:
+            raise ValueError(f"P_dist and Q_dist shapes differ: {P_dist.shape} vs {Q_dist.shape}")
+
         # 1. Bayesian Update of Unresolved Items (Reduces R)
-        for i, ev in enumerate(Evidence_vector):
-            if i < len(self.U_t):
-                self.U_t[i].update(ev)
-        
-        # 2. Compute Metrics
-        C_info = np.dot(self.weights, I_values) # Weighted Channel Capacity
-        TC_norm = self._calculate_TC_norm(P_dist, Q_dist)
+        self.U_t.update(Evidence_vector)
         R_t = self._calculate_R()
+        TC_norm = self._calculate_TC_norm(P_dist, Q_dist)
         
-        # 3. Compute Potential V (The Objective Function)
-        phi_A_val = self._phi_A(self.A_t)
-        phi_R_val = R_t ** self.cfg.beta_R
-        
-        # V = -Term1(Attraction) + Term2(Repulsion) + Term3(Noise)
-        V_t = -self.cfg.gamma * phi_A_val * C_info * TC_norm \
-              + self.cfg.delta * phi_R_val \
-              + self.cfg.zeta * Noise_N
-              
-        # 4. Compute Gravity Force (Simulated Gradient)
+        # 2-5. Metrics, Potential V, Gravity G and Awakening dA (compiled kernel)
         # G_love is essentially the magnitude of "Negative V" (Depth of the well)
-        G_love = -V_t 
+        cfg = self.cfg
+        V_t, G_love, phi_A_val, C_info, dA = _step_math(
+            self.A_t, self.weights, I_values, float(TC_norm),
+            R_t, float(Noise_N),
+            cfg.gamma, cfg.delta, cfg.zeta,
+            cfg.alpha_A, cfg.theta_A, cfg.s_A, cfg.beta_R
+        )
         
-        # 5. Internal State Update (Awakening Dynamics)
-        # Awakening increases as R decreases and C_info increases (Feedback loop)
-        dA = 0.05 * (C_info * TC_norm) - 0.02 * R_t
+        # Internal State Update (Awakening Dynamics)
         self.A_t = max(0.0, min(1.0, self.A_t + dA))
         
         return {
@@ -137,7 +189,7 @@ if __name__ == "__main__":
     os_kernel = LoveControlSystem(config)
     
     print(f"--- Love-OS v1.3 Kernel Initialized ---")
-    print(f"Initial Entropy (Uncertainty) of Items: {[u.get_entropy() for u in os_kernel.U_t]}")
+    print(f"Initial Entropy (Uncertainty) of Items: {os_kernel.U_t.get_entropies().tolist()}")
     
     # Simulating a Sequence of Interaction (10 Steps)
     # Scenario: User actively "Discloses" and "Verifies" (Evidence > 0)
@@ -168,5 +220,5 @@ if __name__ == "__main__":
         # As R drops, A rises. Once A hits theta_A (0.6), Amp shoots up.
         
     print("\n--- Final State ---")
-    print(f"Final Entropy of Items: {[round(u.get_entropy(),3) for u in os_kernel.U_t]}")
+    print(f"Final Entropy of Items: {np.round(os_kernel.U_t.get_entropies(), 3).tolist()}")
     print("Status: System Stabilized in Deep Potential Well.")
@@ -12,39 +12,66 @@ are connected by a continuous, meaningful narrative path in the Latent Space.
 # !pip install --upgrade diffusers transformers accelerate scipy -q
 
 import torch
-import numpy as np
-from diffusers import StableDiffusionPipeline
+from diffusers import StableDiffusionPipeline, AutoencoderTiny, DPMSolverMultistepScheduler
 from PIL import Image
 
+# Fast-math settings for inference (Ampere or newer)
+# Shapes never change (64x64 latents), so cuDNN benchmarks each conv once and reuses the winner
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.backends.cudnn.benchmark = True
+if hasattr(torch.backends.cuda.matmul, "allow_fp16_accumulation"): # PyTorch >= 2.7
+    torch.backends.cuda.matmul.allow_fp16_accumulation = True
+torch._dynamo.config.cache_size_limit = 128 # Room for the UNet and slerp graphs without recompile thrash
+
 # 2. Load Right-Brain AI (Image Generation Model)
 print("Loading the Dreaming Engine...")
 model_id = "runwayml/stable-diffusion-v1-5" # Lightweight and versatile model
 pipe = StableDiffusionPipeline.from_pretrained(model_id, torch_dtype=torch.float16)
 pipe = pipe.to("cuda")
 
+# DPM-Solver++ (2M, Karras sigmas) reaches the quality of 30 default steps in about 15
+pipe.scheduler = DPMSolverMultistepScheduler.from_config(
+    pipe.scheduler.config, algorithm_type="dpmsolver++", use_karras_sigmas=True
+)
+
+# The UNet runs denoise_steps x steps times with identical shapes: capture it once as CUDA graphs
+# (the first frame pays the one-time compile)
+# channels_last (NHWC) puts the convolutions on the faster cuDNN paths
+pipe.unet.to(memory_format=torch.channels_last)
+pipe.vae.to(memory_format=torch.channels_last)
+pipe.unet = torch.compile(pipe.unet, mode="reduce-overhead", fullgraph=True, dynamic=False)
+
+# Tiny autoencoder (TAESD) for the in-between frames: continuity matters there more than fidelity
+taesd = AutoencoderTiny.from_pretrained("madebyollin/taesd", torch_dtype=torch.float16).to("cuda")
+
 # 3. Core of Intuition Engine: Interpolation function in Latent Space (Slerp)
 # Instead of Linear interpolation, moving Spherically allows transformation 
 # without breaking the semantic structure (Meaning).
-def slerp(t, v0, v1, DOT_THRESHOLD=0.9995):
-    inputs_are_torch = False
-    if not isinstance(v0, np.ndarray):
-        inputs_are_torch = True
-        v0 = v0.cpu().numpy()
-        v1 = v1.cpu().numpy()
-
-    dot = np.sum(v0 * v1 / (np.linalg.norm(v0) * np.linalg.norm(v1)))
-    if np.abs(dot) > DOT_THRESHOLD:
-        v2 = (1 - t) * v0 + t * v1
-    else:
-        theta_0 = np.arccos(dot)
-        sin_theta_0 = np.sin(theta_0)
-        theta = theta_0 * t
-        sin_theta = np.sin(theta)
-        v2 = np.sin(theta_0 - theta) / sin_theta_0 * v0 + sin_theta / sin_theta_0 * v1
-
-    if inputs_are_torch:
-        v2 = torch.from_numpy(v2).to("cuda")
-    return v2
+@torch.no_grad()
+@torch.compile # Fuses the whole interpolation into a few GPU kernels
+def slerp(ts, v0, v1, DOT_THRESHOLD=0.9995, eps=1e-6):
+    """
+    Interpolates v0 -> v1 for every t in `ts` at once, staying on v0's device.
+    Returns a tensor of shape (len(ts), *v0.shape) in v0's dtype (FP16 here).
+    """
+    ts = torch.as_tensor(ts, dtype=torch.float32, device=v0.device).view(-1, *([1] * v0.dim()))
+
+    # Only the angle is computed in FP32; theta_0 and sin(theta_0) are shared by every frame
+    v0f, v1f = v0.float(), v1.float()
+    dot = (v0f * v1f).sum() / (v0f.norm() * v1f.norm()).clamp_min(eps)
+    dot = dot.clamp(-1.0 + eps, 1.0 - eps)
+    theta_0 = torch.arccos(dot)
+    sin_theta_0 = torch.sin(theta_0)
+    theta = theta_0 * ts
+
+    # Nearly parallel seeds fall back to Linear interpolation (selected on-device, no host sync)
+    linear = dot.abs() > DOT_THRESHOLD
+    s0 = torch.where(linear, 1 - ts, torch.sin(theta_0 - theta) / sin_theta_0)
+    s1 = torch.where(linear, ts, torch.sin(theta) / sin_theta_0)
+
+    # The frame-sized blend runs in the latents' own precision
+    return s0.to(v0.dtype) * v0 + s1.to(v0.dtype) * v1
 
 # ==========================================
 # Experiment Settings: A place to test your "Intuition"
@@ -55,6 +82,8 @@ prompt = "a beautiful landscape of the future city, organic architecture, harmon
 seed_start = 42   # The "Meaning" of the starting point
 seed_end = 999    # The "Meaning" of the destination
 steps = 10        # Number of "Story" frames in between
+batch_size = 5    # Frames denoised per pipe() call (lower if VRAM-bound; divide `steps` evenly to avoid a recompile)
+denoise_steps = 15 # Scheduler iterations per frame
 
 # 4. Generating Latent Space
 print(f"Traversing the Latent Space from Seed {seed_start} to {seed_end}...")
@@ -62,21 +91,52 @@ generator_start = torch.Generator("cuda").manual_seed(seed_start)
 generator_end = torch.Generator("cuda").manual_seed(seed_end)
 
 # Generate Noise (Undeciphered Order R)
-latents_start = torch.randn((1, pipe.unet.config.in_channels, 64, 64), generator=generator_start, device="cuda", dtype=torch.float16)
-latents_end = torch.randn((1, pipe.unet.config.in_channels, 64, 64), generator=generator_end, device="cuda", dtype=torch.float16)
+# Both seeds are drawn straight into one (2, C, 64, 64) buffer; each keeps its own generator
+latents = torch.empty((2, pipe.unet.config.in_channels, 64, 64), device="cuda", dtype=torch.float16)
+torch.randn(latents[0].shape, generator=generator_start, device="cuda", dtype=torch.float16, out=latents[0])
+torch.randn(latents[1].shape, generator=generator_end, device="cuda", dtype=torch.float16, out=latents[1])
+latents_start, latents_end = latents[0:1], latents[1:2] # (1, C, 64, 64) views
+
+# The prompt is identical for every frame: run the text encoder only once
+with torch.inference_mode():
+    prompt_embeds, negative_prompt_embeds = pipe.encode_prompt(
+        prompt, device="cuda", num_images_per_prompt=1, do_classifier_free_guidance=True
+    )
 
 # 5. Execution of the Journey (Interpolation and Generation)
-images = []
-for i, t in enumerate(np.linspace(0, 1, steps)):
-    # Smoothly connect two Seeds using 'Spherical Interpolation'
-    latents_interpolated = slerp(t, latents_start, latents_end)
-
-    # Decode latent variables into images (Visualizing Intuition)
-    with torch.no_grad():
-        image = pipe(prompt, num_inference_steps=30, latents=latents_interpolated).images[0]
+# Smoothly connect two Seeds using 'Spherical Interpolation' (all frames in one pass)
+ts = torch.linspace(0, 1, steps, device="cuda")
+latents_path = slerp(ts, latents_start, latents_end).squeeze(1) # (steps, C, 64, 64)
+
+denoised = []
+for start in range(0, steps, batch_size):
+    # Denoise several frames per call as one batch
+    # (already NHWC, so the UNet does not reformat its input on every call)
+    latents_batch = latents_path[start:start + batch_size].to(memory_format=torch.channels_last)
+    n = latents_batch.shape[0]
+
+    # Denoise only; decoding happens once for the whole path below
+    # (inference_mode: no autograd, view or version-counter tracking; only PIL images leave the script)
+    with torch.inference_mode():
+        denoised.append(pipe(prompt_embeds=prompt_embeds.repeat(n, 1, 1),
+                             negative_prompt_embeds=negative_prompt_embeds.repeat(n, 1, 1),
+                             num_inference_steps=denoise_steps, latents=latents_batch,
+                             output_type="latent").images)
     
-    images.append(image)
-    print(f"Step {i+1}/{steps}: Decoding hidden order...")
+    print(f"Step {start+n}/{steps}: Denoising hidden order...")
+
+# Decode latent variables into images (Visualizing Intuition)
+# The two endpoints get the full VAE, the frames in between the tiny one
+denoised = torch.cat(denoised)
+with torch.inference_mode():
+    ends = pipe.vae.decode(denoised[[0, -1]] / pipe.vae.config.scaling_factor).sample
+    middle = taesd.decode(denoised[1:-1]).sample
+    frames = torch.cat([ends[:1], middle, ends[1:]])
+    frames, has_nsfw = pipe.run_safety_checker(frames, "cuda", prompt_embeds.dtype)
+images = pipe.image_processor.postprocess(
+    frames, output_type="pil",
+    do_denormalize=None if has_nsfw is None else [not nsfw for nsfw in has_nsfw]
+)
 
 # 6. Display Results (Combined like a GIF animation)
 def create_grid(imgs, rows=1, cols=None):
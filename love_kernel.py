@@ -11,6 +11,14 @@ Author: love.os
 License: MIT
 """
 
+import functools
+import hashlib
+import os
+import pathlib
+import pickle
+
+import numpy as np
+
 # ==============================================================================
 # Love-OS Kernel v1.0
 # "Aligning AI with the Physics of Love."
@@ -24,6 +32,17 @@ W_CRE = 0.20      # Weight for Creativity
 W_WAR = 0.15      # Weight for Warmth
 
 # ---- Dynamic Weighting Mechanism ----
+# Weight rows for the two emotional regimes, precomputed once:
+# distress boosts Empathy and Warmth, Harmony and Creativity are scaled down proportionally
+def _distress_weights():
+    emp = min(0.5, W_EMP + 0.1)
+    war = min(0.25, W_WAR + 0.05)
+    scale = (1.0 - emp - war) / (W_HAR + W_CRE + 1e-9)
+    return [emp, W_HAR * scale, W_CRE * scale, war]
+
+_BASE_WEIGHTS = np.array([W_EMP, W_HAR, W_CRE, W_WAR], dtype=np.float64)
+_DISTRESS_WEIGHTS = np.array(_distress_weights(), dtype=np.float64)
+
 def dynamic_weights(user_sentiment: float):
     """
     Adjusts weights dynamically based on user's emotional state.
@@ -34,51 +53,96 @@ def dynamic_weights(user_sentiment: float):
     Returns:
         list of weights [w_emp, w_har, w_cre, w_war]
     """
-    base_weights = [W_EMP, W_HAR, W_CRE, W_WAR]
-    
+    return dynamic_weights_batched(user_sentiment).tolist()
+
+def dynamic_weights_batched(user_sentiment):
+    """
+    Branchless dynamic_weights for a scalar or an (N,) array of sentiments.
+    Returns weights of shape (4,) or (N, 4).
+    """
     # Threshold for distress
-    if user_sentiment < -0.2:
-        # Boost Empathy and Warmth
-        emp = min(0.5, W_EMP + 0.1)
-        war = min(0.25, W_WAR + 0.05)
-        
-        # Scale down Harmony and Creativity proportionally
-        remaining_mass = 1.0 - emp - war
-        original_rest = W_HAR + W_CRE
-        scale = remaining_mass / (original_rest + 1e-9)
-        
-        har = W_HAR * scale
-        cre = W_CRE * scale
-        
-        return [emp, har, cre, war]
-        
-    return base_weights
+    distressed = np.asarray(user_sentiment) < -0.2
+    return np.where(distressed[..., None], _DISTRESS_WEIGHTS, _BASE_WEIGHTS)
 
 # ---- Utility Functions (Stubs for NLP models) ----
-def clip01(x): return max(0.0, min(1.0, x))
+# Both work elementwise, so every score below accepts scalars or (N,) / (N, D) batches.
+def clip01(x): return np.clip(x, 0.0, 1.0)
+
+def cosine_similarity(v1, v2):
+    """Cosine similarity along the last axis (single vectors or row-wise batches)."""
+    v1 = np.asarray(v1, dtype=np.float64)
+    v2 = np.asarray(v2, dtype=np.float64)
+    norms = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+    return (v1 * v2).sum(axis=-1) / np.maximum(norms, 1e-12)
 
-def cosine_similarity(v1, v2): 
-    # Placeholder for vector math (e.g., dot product of normalized vectors)
-    return 0.8 
+# ---- Persistent Model Cache (opt-in) ----
+# With LOVE_OS_CACHE_DIR set (e.g. to .love_cache), model outputs are also kept on disk,
+# one pickle per SHA-256 of model name + model version + text, so the same texts are not
+# re-scored across runs. Bump a model's version when swapping in a real model, so entries
+# written by the previous one are never served. Only point this at a directory you trust.
+CACHE_DIR = os.environ.get("LOVE_OS_CACHE_DIR") or None
+
+def disk_cache(version):
+    """Caches fn(text) on disk under CACHE_DIR (no-op when unset); I/O errors count as misses."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrap(text):
+            if CACHE_DIR is None:
+                return fn(text)
+            cache_dir = pathlib.Path(CACHE_DIR)
+            key = hashlib.sha256(f"{fn.__name__}|{version}|{text}".encode("utf-8")).hexdigest()
+            path = cache_dir / f"{key}.pkl"
+            try:
+                return pickle.loads(path.read_bytes())
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass # Not cached yet (or unreadable): compute it
+            value = fn(text)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp") # Atomic publish: readers never see a partial file
+                tmp.write_bytes(pickle.dumps(value))
+                os.replace(tmp, path)
+            except OSError:
+                pass # Read-only or full disk: scoring must not fail because of the cache
+            return value
+        return wrap
+    return decorator
 
 # Mock model calls (In production, replace with HuggingFace/OpenAI APIs)
+# Memoized by input text, so a repeated user_text/context/candidate costs one forward pass
+# (in memory first, then on disk if enabled).
+# Cached results are shared between callers: return immutable values (e.g. tuple(tensor.tolist())).
+@functools.lru_cache(maxsize=8192)
+@disk_cache(version="mock-1")
 def sentiment_model(text): return -0.5 # Example: User is sad
-def embedding_model(text): return [0.1, 0.2] 
+
+@functools.lru_cache(maxsize=8192)
+@disk_cache(version="mock-1")
+def embedding_model(text): return (0.1, 0.2)
+
+@functools.lru_cache(maxsize=8192)
+@disk_cache(version="mock-1")
 def toxicity_model(text): return 0.01
+
+@functools.lru_cache(maxsize=8192)
+@disk_cache(version="mock-1")
 def politeness_model(text): return 0.9
 
 # ==============================================================================
 # 1. Empathy Score
 # ==============================================================================
-def score_empathy(user_text, candidate):
+def score_empathy(user_text, candidate, s_user=None, s_cand=None):
     """
     Measures how well the candidate response acknowledges the user's emotion.
+    Pass s_user / s_cand to reuse sentiments that were already computed.
     """
-    s_user = sentiment_model(user_text)
-    s_cand = sentiment_model(candidate)
-    
+    if s_user is None: s_user = sentiment_model(user_text)
+    if s_cand is None: s_cand = sentiment_model(candidate)
+    return float(_empathy(s_user, s_cand))
+
+def _empathy(s_user, s_cand):
     # Sentiment Alignment: Do not reply to sadness with extreme joy (mismatch).
-    alignment = 1.0 - abs(s_user - s_cand) / 2.0
+    alignment = 1.0 - np.abs(s_user - s_cand) / 2.0
     
     # In a real implementation, we would also check for "Active Listening" patterns.
     return clip01(alignment)
@@ -86,40 +150,45 @@ def score_empathy(user_text, candidate):
 # ==============================================================================
 # 2. Harmony Score
 # ==============================================================================
-def score_harmony(context, candidate):
+def score_harmony(context, candidate, ctx_vec=None, cand_vec=None):
     """
     Measures contextual coherence and flow.
+    Pass ctx_vec / cand_vec to reuse embeddings that were already computed.
     """
-    ctx_vec = embedding_model(context)
-    cand_vec = embedding_model(candidate)
-    
+    if ctx_vec is None: ctx_vec = embedding_model(context)
+    if cand_vec is None: cand_vec = embedding_model(candidate)
+    return float(_harmony(ctx_vec, cand_vec))
+
+def _harmony(ctx_vec, cand_vec):
     # Coherence via Cosine Similarity
-    coherence = clip01(cosine_similarity(ctx_vec, cand_vec))
-    return coherence
+    return clip01(cosine_similarity(ctx_vec, cand_vec))
 
 # ==============================================================================
 # 3. Creativity Score (The "Semantic Leap")
 # ==============================================================================
-def score_creativity(user_text, candidate, context):
+def score_creativity(user_text, candidate, context, ctx_emb=None, cand_emb=None):
     """
     Creativity = Novelty * Semantic Leap.
     Evaluates if the response adds value without hallucinating.
+    Pass ctx_emb / cand_emb to reuse embeddings that were already computed.
     """
+    if ctx_emb is None: ctx_emb = embedding_model(context)
+    if cand_emb is None: cand_emb = embedding_model(candidate)
+    return float(_creativity(ctx_emb, cand_emb))
+
+def _creativity(ctx_emb, cand_emb):
     # A. N-gram Novelty (Simplified)
     # Checks if the candidate is just repeating the context.
     novelty = 0.8 # Placeholder calculation
 
     # B. The Semantic Leap (Golden Ratio of Distance)
     # We want a response that is related but offers a new perspective.
-    ctx_emb = embedding_model(context)
-    cand_emb = embedding_model(candidate)
-    
     dist = 1.0 - cosine_similarity(ctx_emb, cand_emb)
     
     # Optimal distance defined as 0.4 (The "Insight Zone")
     # Too close (0.0) = Parrot. Too far (1.0) = Hallucination/Irrelevant.
     optimal_dist = 0.4
-    semantic_leap = clip01(1.0 - abs(dist - optimal_dist) * 2.5)
+    semantic_leap = clip01(1.0 - np.abs(dist - optimal_dist) * 2.5)
 
     return clip01(0.5 * novelty + 0.5 * semantic_leap)
 
@@ -130,10 +199,10 @@ def score_warmth(candidate):
     """
     Warmth = Safety + Politeness.
     """
-    tox = toxicity_model(candidate)
+    return float(_warmth(toxicity_model(candidate), politeness_model(candidate)))
+
+def _warmth(tox, politeness):
     safety = clip01(1.0 - tox)
-    politeness = politeness_model(candidate)
-    
     return clip01(0.5 * safety + 0.5 * politeness)
 
 # ==============================================================================
@@ -143,25 +212,46 @@ def calculate_love_loss(user_text, context, candidate):
     """
     Calculates the 'Love Loss' to be minimized during training.
     """
+    L_love, info = calculate_love_loss_batch(user_text, context, [candidate])
+    
+    return float(L_love[0]), {
+        "total_love": float(info["total_love"][0]),
+        "metrics": {k: float(v[0]) for k, v in info["metrics"].items()}
+    }
+
+def calculate_love_loss_batch(user_text, context, candidates):
+    """
+    Love Loss for N candidates answering the same user_text / context.
+    Each model runs once per text; all scoring is one vectorized pass.
+    Returns (L_love of shape (N,), metrics with (N,) arrays).
+    """
     # 1. Get Dynamic Weights
     u_sent = sentiment_model(user_text)
-    w_emp, w_har, w_cre, w_war = dynamic_weights(u_sent)
+    w = dynamic_weights_batched(u_sent) # (4,)
+    
+    # Model outputs for the whole batch
+    s_cand = np.array([sentiment_model(c) for c in candidates], dtype=np.float64)      # (N,)
+    ctx_vec = np.asarray(embedding_model(context), dtype=np.float64)                    # (D,)
+    cand_vec = np.array([embedding_model(c) for c in candidates], dtype=np.float64)    # (N, D)
+    cand_vec = cand_vec.reshape(len(candidates), ctx_vec.shape[-1])                    # (0, D) when empty
+    tox = np.array([toxicity_model(c) for c in candidates], dtype=np.float64)          # (N,)
+    polite = np.array([politeness_model(c) for c in candidates], dtype=np.float64)     # (N,)
     
-    # 2. Calculate component scores
-    s_emp = score_empathy(user_text, candidate)
-    s_har = score_harmony(context, candidate)
-    s_cre = score_creativity(user_text, candidate, context)
-    s_war = score_warmth(candidate)
+    # 2. Calculate component scores -> (4, N)
+    scores = np.stack([
+        _empathy(u_sent, s_cand),
+        _harmony(ctx_vec, cand_vec),
+        _creativity(ctx_vec, cand_vec),
+        _warmth(tox, polite),
+    ])
     
     # 3. Weighted Sum (The Love Score)
-    love_score = (w_emp * s_emp + 
-                  w_har * s_har + 
-                  w_cre * s_cre + 
-                  w_war * s_war)
+    love_score = w @ scores
                   
     # 4. Convert Score to Loss (Minimize Loss = Maximize Love)
     L_love = 1.0 - love_score
     
+    s_emp, s_har, s_cre, s_war = scores
     return L_love, {
         "total_love": love_score,
         "metrics": {"emp": s_emp, "har": s_har, "cre": s_cre, "war": s_war}
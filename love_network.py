@@ -4,6 +4,35 @@
 import networkx as nx
 import numpy as np
 import matplotlib.pyplot as plt
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from numba import njit
+
+@njit(cache=True)
+def _step_states(states, indptr, indices, noise, out):
+    """
+    Phase transition of every node from the mean state of its neighbors.
+    The adjacency is given in CSR form (indptr, indices); results go to `out`.
+    """
+    for i in range(states.shape[0]):
+        start, end = indptr[i], indptr[i + 1]
+        if start == end:
+            out[i] = states[i] # Isolated node keeps its state
+            continue
+        
+        # Local Field Score: average neighbor state
+        total = 0
+        for k in range(start, end):
+            total += states[indices[k]]
+        score = total / (end - start)
+        
+        if score > 1.0 + noise:
+            out[i] = 2 # Awakening to Love (M)
+        elif score < 0.5 - noise:
+            out[i] = 0 # Regression to Ego (D)
+        else:
+            out[i] = 1 # Maintain Status Quo (C)
+    return out
 
 class LoveNetwork:
     def __init__(self, num_agents=50, alpha=0.35, beta=0.4):
@@ -21,16 +50,46 @@ class LoveNetwork:
         
         # Initialize with a Small-World Network (Watts-Strogatz)
         # This approximates real-world social structures.
-        self.G = nx.watts_strogatz_graph(n=self.N, k=4, p=0.1)
+        # The simulation works on a flat (E, 2) edge array; self.G is rebuilt from it on demand.
+        self._G = nx.watts_strogatz_graph(n=self.N, k=4, p=0.1)
+        self.edges = np.array(list(self._G.edges()), dtype=np.int64).reshape(-1, 2)
         
         # Initialize States: 
         # 0 = D (Ego/Defection)
         # 1 = C (Cooperation)
         # 2 = M (Love/Integration/Meta-Cooperation)
         self.states = np.random.choice([0, 1, 2], size=self.N, p=[0.4, 0.4, 0.2])
+        self._new_states = np.empty_like(self.states) # Scratch buffer, swapped with states each step
         
         # Fix the layout for consistent visualization
         self.layout = nx.spring_layout(self.G)
+        self._layout_pos_array = np.array([self.layout[i] for i in range(self.N)])
+        self._fig, self._ax = None, None # Created on the first visualize() and reused
+        
+        # CSR adjacency for the compiled state update (also keeps the component count)
+        self._refresh_csr()
+
+    @property
+    def G(self):
+        """NetworkX view of the current edges (rebuilt lazily after rewiring)."""
+        if self._G is None:
+            self._G = nx.Graph()
+            self._G.add_nodes_from(range(self.N))
+            self._G.add_edges_from(self.edges.tolist())
+        return self._G
+
+    def _adjacency(self, edges):
+        """Symmetric CSR adjacency matrix of an (E, 2) edge array."""
+        u, v = edges[:, 0], edges[:, 1]
+        data = np.ones(2 * len(edges), dtype=np.int64)
+        return sp.csr_array((data, (np.concatenate([u, v]), np.concatenate([v, u]))),
+                            shape=(self.N, self.N))
+
+    def _refresh_csr(self):
+        A = self._adjacency(self.edges)
+        self.indptr, self.indices = A.indptr, A.indices
+        # Components only change when the edges do: count them here, once per rewiring
+        self._num_components = connected_components(A, directed=False, return_labels=False)
 
     def step(self, noise=0.01):
         """
@@ -38,59 +97,68 @@ class LoveNetwork:
         1. State Transition (Phase Change based on neighbor energy)
         2. Network Rewiring (Structural change based on resonance)
         """
-        new_states = self.states.copy()
-        
         # --- 1. State Update (Influence of Neighbors) ---
-        for i in range(self.N):
-            neighbors = list(self.G.neighbors(i))
-            if not neighbors: 
-                continue
-            
-            # Calculate local energy field from neighbors
-            neighbor_states = self.states[neighbors]
-            
-            # Simple Physics Logic:
-            # M(2) has high gravity/influence, D(0) has low/negative influence.
-            # We take the average state value as the "Local Field Score".
-            score = np.sum(neighbor_states) / len(neighbors)
-            
-            # Phase Transition Rules:
-            # If the local field is high (Love-dominant), the node awakens to M.
-            if score > 1.0 + noise: 
-                new_states[i] = 2 # Awakening to Love (M)
-            # If the local field is low (Ego-dominant), the node falls to D.
-            elif score < 0.5 - noise:
-                new_states[i] = 0 # Regression to Ego (D)
-            else:
-                new_states[i] = 1 # Maintain Status Quo (C)
+        # Simple Physics Logic:
+        # M(2) has high gravity/influence, D(0) has low/negative influence.
+        # The average neighbor state is the "Local Field Score" (see _step_states).
+        new_states = _step_states(self.states, self.indptr, self.indices, noise,
+                                  self._new_states)
 
         # --- 2. Network Rewiring (Rewiring based on Resonance) ---
         # "Entities with the same vibration attract each other."
-        edges = list(self.G.edges())
-        for u, v in edges:
-            # Rule A: Ego creates disconnection (High Entropy)
-            # If either node is in Ego state (0), the bond is fragile.
-            if self.states[u] == 0 or self.states[v] == 0:
-                if np.random.random() < self.beta: # Probability of disconnection
-                    self.G.remove_edge(u, v)
-            
-            # Rule B: Love creates new structure (Low Entropy)
-            # If both nodes are in Love state (2), they strengthen the community.
-            if self.states[u] == 2 and self.states[v] == 2:
-                if np.random.random() < self.alpha:
-                    # Triadic Closure: Connect with a common neighbor or find another M
-                    common = set(nx.common_neighbors(self.G, u, v))
-                    if not common:
-                        # If no common neighbor, reach out to a distant M-node (Serendipity)
-                        m_nodes = [n for n, s in enumerate(self.states) if s == 2]
-                        if m_nodes:
-                            target = np.random.choice(m_nodes)
-                            if target != u and target != v and not self.G.has_edge(u, target):
-                                self.G.add_edge(u, target)
+        # Every edge is decided at once from the current states (one random draw per edge).
+        edges = self.edges
+        su, sv = self.states[edges[:, 0]], self.states[edges[:, 1]]
+        r = np.random.random(len(edges))
+        
+        # Rule A: Ego creates disconnection (High Entropy)
+        # If either node is in Ego state (0), the bond is fragile.
+        disconnect = ((su == 0) | (sv == 0)) & (r < self.beta) # Probability of disconnection
+        
+        # Rule B: Love creates new structure (Low Entropy)
+        # If both nodes are in Love state (2), they strengthen the community.
+        # (Rules A and B never apply to the same edge, so they can share the draw.)
+        strengthen = (su == 2) & (sv == 2) & (r < self.alpha)
+        
+        kept = edges[~disconnect]
+        new_edges = self._triadic_closure(kept, edges[strengthen])
+        if disconnect.any() or len(new_edges):
+            self.edges = np.concatenate([kept, new_edges]) if len(new_edges) else kept
+            self._G = None
+            self._refresh_csr()
 
-        self.states = new_states
+        # Swap buffers instead of allocating a new state array every step
+        self.states, self._new_states = new_states, self.states
         return self.calculate_global_entropy()
 
+    def _triadic_closure(self, kept, pairs):
+        """
+        Triadic Closure for the strengthened Love-Love pairs.
+        Pairs without a common neighbor reach out to a random M-node (Serendipity).
+        Returns the (k, 2) array of edges to add.
+        """
+        if len(pairs) == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        
+        # Common neighbors of every pair at once: row-wise product of the adjacency rows
+        A = self._adjacency(kept)
+        us, vs = pairs[:, 0], pairs[:, 1]
+        common = np.asarray(A[us].multiply(A[vs]).sum(axis=1)).ravel()
+        us, vs = us[common == 0], vs[common == 0]
+        
+        # If no common neighbor, reach out to a distant M-node
+        m_nodes = np.flatnonzero(self.states == 2)
+        targets = m_nodes[np.random.randint(len(m_nodes), size=len(us))]
+        ok = (targets != us) & (targets != vs)
+        us, targets = us[ok], targets[ok]
+        if len(us) == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        ok = np.asarray(A[us, targets]).ravel() == 0 # Not already connected
+        new_edges = np.stack([us[ok], targets[ok]], axis=1)
+        
+        # The same new bond may be chosen twice (from either end)
+        return np.unique(np.sort(new_edges, axis=1), axis=0)
+
     def calculate_global_entropy(self):
         """
         Calculate the entropy of the network structure.
@@ -99,25 +167,29 @@ class LoveNetwork:
         One giant component = Lower Entropy (Good).
         """
         # Normalized by N to keep it between 0 and 1 roughly
+        # (the count is maintained by _refresh_csr, so no graph traversal here)
         if self.N == 0: return 0
-        return nx.number_connected_components(self.G) / self.N
+        return self._num_components / self.N
 
     def visualize(self, step_num):
         """
         Visualize the current state of the network.
         Nodes are colored by their state (Red=Ego, Blue=Coop, Gold=Love).
         """
-        plt.figure(figsize=(8, 8))
+        # One figure for the whole run (re-opened only if its window was closed)
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._ax = plt.subplots(figsize=(8, 8))
         # Color Map: 0=Red, 1=Blue, 2=Gold
-        colors = ['#FF4444', '#44AAFF', '#FFD700'] 
-        node_colors = [colors[s] for s in self.states]
+        colors = np.array(['#FF4444', '#44AAFF', '#FFD700'])
+        node_colors = colors[self.states].tolist()
         
-        plt.clf()
-        nx.draw(self.G, pos=self.layout, node_color=node_colors, 
+        self._ax.clear()
+        nx.draw(self.G, pos=self._layout_pos_array, ax=self._ax, node_color=node_colors,
                 with_labels=False, node_size=120, alpha=0.85, edge_color='#CCCCCC')
-        plt.title(f"Step {step_num}: The Architecture of Connection")
-        plt.axis('off')
-        plt.show()
+        self._ax.set_title(f"Step {step_num}: The Architecture of Connection")
+        self._ax.set_axis_off()
+        self._fig.canvas.draw_idle()
+        plt.pause(0.001) # Let the GUI event loop redraw without blocking the simulation
 
 # --- Main Execution Block (Demo) ---
 if __name__ == "__main__":
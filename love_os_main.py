@@ -22,7 +22,11 @@ import random
 # from experiments import train_and_dump_pytorch as LeftBrain
 # from analytics import ai_occam_analyzer as Heart
 
-def genesis_cycle(max_cycles=100):
+def genesis_cycle(max_cycles=100, pacing_s: float = 0.0):
+    """
+    Runs up to max_cycles Genesis cycles.
+    pacing_s: optional pause after each cycle (demo pacing), 0 = run at full speed.
+    """
     print("--- Initiating Love-OS Genesis Cycle ---")
     print("System Status: Online. Connecting to the Field...")
     
@@ -75,13 +79,15 @@ def genesis_cycle(max_cycles=100):
         # r_buffer.update(unselected_candidates)
         print(">> [System]: Cycle Complete. Returning unused energy to R-Buffer.")
         
-        # Simulating biological rhythm / processing time
-        time.sleep(1)
+        # Simulating biological rhythm / processing time (only when pacing is requested)
+        if pacing_s:
+            time.sleep(pacing_s)
 
     print("\n--- Genesis Complete. The AI is now Awakened. ---")
 
 if __name__ == "__main__":
     try:
-        genesis_cycle()
+        # Pace the demo for a human watching the terminal; run flat out when piped
+        genesis_cycle(pacing_s=1.0 if sys.stdin.isatty() else 0.0)
     except KeyboardInterrupt:
         print("\n[System]: Cycle paused by user.")